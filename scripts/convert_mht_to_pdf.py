@@ -1,25 +1,99 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import base64
 import hashlib
+import io
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, fields as dataclass_fields
 from datetime import datetime, timedelta, timezone
 from email import policy
+from email.message import EmailMessage
 from email.parser import BytesParser
+from functools import lru_cache, partial
+from itertools import count
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 
-from bs4 import BeautifulSoup
+import lxml.html
+import pikepdf
+import websocket
 from dateutil import parser as dateparser
-from pypdf import PdfReader, PdfWriter
-from pypdf.xmp import XmpInformation
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 MAX_RENDER_PATH = 245
+MHT_SUFFIXES = (".mht", ".mhtml")
+DEFAULT_JOBS = min(os.cpu_count() or 1, 4)
+EXTRACT_CACHE_SIZE = 1024
+BROWSER_STARTUP_TIMEOUT = 30
+BROWSER_RENDER_TIMEOUT = 120
+BROWSER_FLAGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--remote-debugging-port=0",
+    # Nothing below is needed to print a local archive; skipping it shortens startup and layout.
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--disable-features=TranslateUI,MediaRouter,OptimizationHints",
+    "--disable-dev-shm-usage",
+    "--hide-scrollbars",
+    "--mute-audio",
+]
+
+LDJSON_RE = re.compile(r"ld\+json", re.I)
+CANONICAL_RE = re.compile(r"canonical", re.I)
+BACKSLASH_GAP_RE = re.compile(r"\\\s+\\")
+SLASH_GAP_RE = re.compile(r"/\s+/")
+# Without huge_tree, libxml2 silently drops everything after a text node or attribute
+# over ~10 MB (e.g. inlined <style> or data: URIs), losing the <title> and <meta> tags.
+HTML_PARSER = lxml.html.HTMLParser(huge_tree=True)
+UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8", huge_tree=True)
+JSON_LD_CACHE_MAX_CHARS = 16 * 1024
+JSON_LD_FIELDS = ("headline", "datePublished", "url", "publisher", "author")
+
+_log_lock = threading.Lock()
+_log_file = None
+_worker_state = threading.local()
+_worker_ids = count(1)
+_browsers_lock = threading.Lock()
+_browsers = []
+_output_locks_lock = threading.Lock()
+_output_locks = {}
+_extract_cache_lock = threading.Lock()
+_extract_cache = OrderedDict()
+
+
+@dataclass
+class ConvertContext:
+    source_root: Path
+    output_root: Path
+    has_explicit_output_root: bool
+    use_per_dir_archive: bool
+    skip_existing: bool
+    norm_root: Path
+    browser_exe: Path
+    converted_iso: str
 
 
 @dataclass
@@ -40,12 +114,20 @@ class ExtractedMetadata:
     confidence: str = "derived"
 
 
-def log(msg: str, log_path: Path) -> None:
-    line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {msg}"
+def open_log(log_path: Path) -> None:
+    global _log_file
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
-    print(line)
+    # One buffered handle for the whole run instead of an open/close per line.
+    _log_file = log_path.open("a", encoding="utf-8", buffering=1 << 16)
+    atexit.register(_log_file.close)
+
+
+def log(msg: str) -> None:
+    line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {msg}"
+    with _log_lock:
+        _log_file.write(line)
+        _log_file.write("\n")
+        print(line)
 
 
 def resolve_browser(choice: str) -> Path:
@@ -94,7 +176,7 @@ def parse_dt(dt_str: str) -> Optional[datetime]:
 def clean_text(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    cleaned = re.sub(r"\s+", " ", value).strip()
+    cleaned = " ".join(value.split())
     return cleaned or None
 
 
@@ -103,8 +185,8 @@ def normalize_path_arg(value: str) -> str:
     # embedded newlines/indentation in a quoted path argument.
     s = (value or "").strip().strip('"').strip("'")
     s = s.replace("\r", "").replace("\n", "").replace("\t", "")
-    s = re.sub(r"\\\s+\\", r"\\", s)
-    s = re.sub(r"/\s+/", "/", s)
+    s = BACKSLASH_GAP_RE.sub(r"\\", s)
+    s = SLASH_GAP_RE.sub("/", s)
     return s
 
 
@@ -145,68 +227,138 @@ def first_nonempty(*values):
     return None
 
 
-def extract_json_ld(soup: BeautifulSoup) -> dict:
+def parse_html(markup: str) -> lxml.html.HtmlElement:
+    try:
+        return lxml.html.document_fromstring(markup, parser=HTML_PARSER)
+    except ValueError:
+        # lxml rejects str input carrying an <?xml encoding=...?> declaration.
+        return lxml.html.document_fromstring(markup.encode("utf-8"), parser=UTF8_HTML_PARSER)
+    except etree.ParserError:
+        # Blank document: nothing to extract, but callers still get a root element.
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def json_loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. it rejects NaN/Infinity); retry there.
+            pass
+    return json.loads(data)
+
+
+def parse_json_ld_blob(text: str) -> dict:
     out = {}
-    scripts = soup.find_all("script", attrs={"type": re.compile(r"ld\+json", re.I)})
-    for sc in scripts:
-        text = sc.string or sc.get_text("", strip=True)
-        if not text:
+    try:
+        payload = json_loads(text)
+    except Exception:
+        return out
+    nodes = payload if isinstance(payload, list) else [payload]
+    for n in nodes:
+        if not isinstance(n, dict):
             continue
-        try:
-            payload = json.loads(text)
-        except Exception:
+        if not out.get("headline") and isinstance(n.get("headline"), str):
+            out["headline"] = n["headline"]
+        if not out.get("datePublished") and isinstance(n.get("datePublished"), str):
+            out["datePublished"] = n["datePublished"]
+        if not out.get("url") and isinstance(n.get("url"), str):
+            out["url"] = n["url"]
+        if not out.get("publisher"):
+            pub = n.get("publisher")
+            if isinstance(pub, dict):
+                name = pub.get("name")
+                if isinstance(name, str):
+                    out["publisher"] = name
+        if not out.get("author"):
+            auth = n.get("author")
+            if isinstance(auth, dict) and isinstance(auth.get("name"), str):
+                out["author"] = auth.get("name")
+            elif isinstance(auth, list):
+                names = []
+                for a in auth:
+                    if isinstance(a, dict) and isinstance(a.get("name"), str):
+                        names.append(a.get("name"))
+                    elif isinstance(a, str):
+                        names.append(a)
+                if names:
+                    out["author"] = ", ".join(dict.fromkeys(names))
+            elif isinstance(auth, str):
+                out["author"] = auth
+        if all(out.get(k) for k in JSON_LD_FIELDS):
+            break
+    return out
+
+
+@lru_cache(maxsize=4096)
+def cached_json_ld_blob(text: str) -> Mapping[str, str]:
+    # Pages harvested from one site repeat the same JSON-LD scaffolding, so the
+    # trimmed fields of each distinct small blob are cached by its text.
+    return MappingProxyType(parse_json_ld_blob(text))
+
+
+def extract_json_ld(tree: lxml.html.HtmlElement) -> dict:
+    out = {}
+    for sc in tree.iter("script"):
+        if not LDJSON_RE.search(sc.get("type") or ""):
             continue
-        nodes = payload if isinstance(payload, list) else [payload]
-        for n in nodes:
-            if not isinstance(n, dict):
-                continue
-            if not out.get("headline") and isinstance(n.get("headline"), str):
-                out["headline"] = n["headline"]
-            if not out.get("datePublished") and isinstance(n.get("datePublished"), str):
-                out["datePublished"] = n["datePublished"]
-            if not out.get("url") and isinstance(n.get("url"), str):
-                out["url"] = n["url"]
-            if not out.get("publisher"):
-                pub = n.get("publisher")
-                if isinstance(pub, dict):
-                    name = pub.get("name")
-                    if isinstance(name, str):
-                        out["publisher"] = name
-            if not out.get("author"):
-                auth = n.get("author")
-                if isinstance(auth, dict) and isinstance(auth.get("name"), str):
-                    out["author"] = auth.get("name")
-                elif isinstance(auth, list):
-                    names = []
-                    for a in auth:
-                        if isinstance(a, dict) and isinstance(a.get("name"), str):
-                            names.append(a.get("name"))
-                        elif isinstance(a, str):
-                            names.append(a)
-                    if names:
-                        out["author"] = ", ".join(dict.fromkeys(names))
-                elif isinstance(auth, str):
-                    out["author"] = auth
+        text = sc.text
+        if not text or not text.strip():
+            continue
+        # The cache keys on the full text, so large one-off blobs (live blogs,
+        # product catalogs) are parsed directly rather than pinned in memory.
+        if len(text) <= JSON_LD_CACHE_MAX_CHARS:
+            blob = cached_json_ld_blob(text)
+        else:
+            blob = parse_json_ld_blob(text)
+        for key, value in blob.items():
+            if not out.get(key):
+                out[key] = value
+        if all(out.get(k) for k in JSON_LD_FIELDS):
+            return out
     return out
 
 
-def extract_from_mht(path: Path) -> ExtractedMetadata:
-    raw = path.read_bytes()
-    sha256 = hashlib.sha256(raw).hexdigest()
-    msg = BytesParser(policy=policy.default).parsebytes(raw)
+class HashingReader(io.RawIOBase):
+    # Feeds every byte read into a digest so hashing and MIME parsing share one pass
+    # over the file instead of holding a full raw copy alongside the parsed message.
+
+    def __init__(self, fp, digest):
+        self.fp = fp
+        self.digest = digest
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self.fp.read(len(b))
+        n = len(data)
+        b[:n] = data
+        self.digest.update(data)
+        return n
+
+
+def load_mht(fp) -> EmailMessage:
+    return BytesParser(policy=policy.default).parse(fp)
+
+
+def parse_loaded_mht(msg: EmailMessage, path: Path) -> dict:
+    def header(name):
+        # email.message lookups are already case-insensitive.
+        value = msg.get(name)
+        return str(value) if value is not None else None
 
-    top_headers = {k.lower(): str(v) for k, v in msg.items()}
     source_mime = msg.get_content_type().lower() if msg.get_content_type() else "application/octet-stream"
 
     header_url = first_nonempty(
-        top_headers.get("snapshot-content-location"),
-        top_headers.get("content-location"),
-        top_headers.get("x-original-url"),
-        top_headers.get("x-source-url"),
+        header("Snapshot-Content-Location"),
+        header("Content-Location"),
+        header("X-Original-URL"),
+        header("X-Source-URL"),
     )
     header_date = first_nonempty(
-        top_headers.get("date"),
-        top_headers.get("x-msfilelastmodified"),
+        header("Date"),
+        header("X-MSFileLastModified"),
     )
 
     html = None
@@ -214,14 +366,18 @@ def extract_from_mht(path: Path) -> ExtractedMetadata:
     if msg.is_multipart():
         for part in msg.walk():
             ctype = part.get_content_type().lower()
-            if ctype == "text/html" and html is None:
-                try:
-                    payload = part.get_payload(decode=True)
-                    charset = part.get_content_charset() or "utf-8"
-                    html = payload.decode(charset, errors="replace") if payload else None
-                except Exception:
-                    html = None
-                part_url = first_nonempty(part.get("Content-Location"), part_url)
+            if ctype != "text/html":
+                continue
+            try:
+                payload = part.get_payload(decode=True)
+                charset = part.get_content_charset() or "utf-8"
+                html = payload.decode(charset, errors="replace") if payload else None
+            except Exception:
+                html = None
+            part_url = first_nonempty(part.get("Content-Location"), part_url)
+            # The first decodable HTML part is the page; the rest are images, CSS and frames.
+            if html is not None:
+                break
     else:
         ctype = msg.get_content_type().lower()
         if ctype == "text/html":
@@ -230,22 +386,30 @@ def extract_from_mht(path: Path) -> ExtractedMetadata:
             html = payload.decode(charset, errors="replace") if payload else None
 
     if not html:
-        html = raw.decode("utf-8", errors="replace")
+        html = path.read_bytes().decode("utf-8", errors="replace")
+
+    tree = parse_html(html)
 
-    soup = BeautifulSoup(html, "html.parser")
+    # First <meta> wins per (attribute, lowercased value), matching a top-down find().
+    meta_map = {}
+    for tag in tree.iter("meta"):
+        content = tag.get("content")
+        for attr in ("property", "name", "http-equiv"):
+            value = tag.get(attr)
+            if isinstance(value, str):
+                meta_map.setdefault((attr, value.lower()), content)
 
     def meta_content(attr, value):
-        tag = soup.find("meta", attrs={attr: re.compile(rf"^{re.escape(value)}$", re.I)})
-        return tag.get("content") if tag else None
+        return meta_map.get((attr, value.lower()))
 
-    json_ld = extract_json_ld(soup)
+    json_ld = extract_json_ld(tree)
 
     title = first_nonempty(
         meta_content("property", "og:title"),
         meta_content("name", "twitter:title"),
         meta_content("name", "title"),
         json_ld.get("headline"),
-        soup.title.string if soup.title else None,
+        tree.findtext(".//title"),
     )
 
     author = first_nonempty(
@@ -266,8 +430,11 @@ def extract_from_mht(path: Path) -> ExtractedMetadata:
         header_date,
     )
 
-    canonical = soup.find("link", attrs={"rel": re.compile(r"canonical", re.I)})
-    canonical_href = canonical.get("href") if canonical else None
+    canonical_href = None
+    for link in tree.iter("link"):
+        if CANONICAL_RE.search(link.get("rel") or ""):
+            canonical_href = link.get("href")
+            break
 
     source_url = first_nonempty(
         canonical_href,
@@ -288,10 +455,7 @@ def extract_from_mht(path: Path) -> ExtractedMetadata:
         json_ld.get("publisher"),
     )
 
-    language = None
-    html_tag = soup.find("html")
-    if html_tag:
-        language = clean_text(html_tag.get("lang"))
+    language = clean_text(tree.get("lang"))
 
     desc = first_nonempty(
         meta_content("name", "description"),
@@ -301,7 +465,7 @@ def extract_from_mht(path: Path) -> ExtractedMetadata:
     dt = parse_dt(published_raw)
     published_date_iso = dt.astimezone(timezone.utc).isoformat() if dt else None
 
-    return ExtractedMetadata(
+    return dict(
         title=title,
         author=author,
         published_date_iso=published_date_iso,
@@ -310,8 +474,49 @@ def extract_from_mht(path: Path) -> ExtractedMetadata:
         keywords=keywords,
         language=language,
         publisher=publisher,
-        archive_capture_iso=datetime.fromtimestamp(path.stat().st_ctime, tz=timezone.utc).isoformat(),
         source_mime=source_mime,
+    )
+
+
+def cached_fields(sha256: str) -> Optional[dict]:
+    with _extract_cache_lock:
+        fields = _extract_cache.get(sha256)
+        if fields is not None:
+            _extract_cache.move_to_end(sha256)
+        return fields
+
+
+def cache_fields(sha256: str, fields: dict) -> dict:
+    with _extract_cache_lock:
+        _extract_cache[sha256] = fields
+        if len(_extract_cache) > EXTRACT_CACHE_SIZE:
+            _extract_cache.popitem(last=False)
+    return fields
+
+
+def extract_from_mht(path: Path) -> ExtractedMetadata:
+    # Content-derived fields are shared by byte-identical archives (re-saved articles,
+    # mirrored directories); only the per-path capture time is recomputed.
+    with path.open("rb") as fp:
+        if sys.version_info >= (3, 11):
+            # file_digest hashes in a C loop (OpenSSL, SHA-NI where available), and
+            # knowing the hash first lets a cache hit skip the MIME parse entirely.
+            sha256 = hashlib.file_digest(fp, "sha256").hexdigest()
+            fields = cached_fields(sha256)
+            if fields is None:
+                fp.seek(0)
+                fields = cache_fields(sha256, parse_loaded_mht(load_mht(fp), path))
+        else:
+            digest = hashlib.sha256()
+            msg = load_mht(io.BufferedReader(HashingReader(fp, digest)))
+            sha256 = digest.hexdigest()
+            fields = cached_fields(sha256)
+            if fields is None:
+                fields = cache_fields(sha256, parse_loaded_mht(msg, path))
+
+    return ExtractedMetadata(
+        **fields,
+        archive_capture_iso=datetime.fromtimestamp(path.stat().st_ctime, tz=timezone.utc).isoformat(),
         content_sha256=sha256,
     )
 
@@ -328,32 +533,157 @@ def pdf_dt_from_iso(iso: str) -> str:
     return dt_utc.strftime("D:%Y%m%d%H%M%S+00'00'")
 
 
-def render_pdf(browser_exe: Path, in_file: Path, out_pdf: Path, profile_base: Path) -> subprocess.CompletedProcess:
-    file_profile = profile_base / str(os.urandom(8).hex())
-    file_profile.mkdir(parents=True, exist_ok=True)
+class CdpBrowser:
+    # One long-lived headless browser driven over the Chrome DevTools Protocol,
+    # so a worker pays browser startup once instead of once per file.
 
-    uri = in_file.resolve().as_uri()
+    def __init__(self, browser_exe: Path, profile_dir: Path):
+        self.browser_exe = browser_exe
+        self.profile_dir = profile_dir
+        self.proc = None
+        self.ws = None
+        self.session_id = None
+        self.events = []
+        self.next_id = 0
 
-    cmd = [
-        str(browser_exe),
-        "--headless=new",
-        "--disable-gpu",
-        "--no-first-run",
-        "--no-default-browser-check",
-        f"--user-data-dir={str(file_profile)}",
-        f"--print-to-pdf={str(out_pdf)}",
-        uri,
-    ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
+    def start(self) -> None:
+        port_file = self.profile_dir / "DevToolsActivePort"
+        port_file.unlink(missing_ok=True)
+        cmd = [str(self.browser_exe), *BROWSER_FLAGS, f"--user-data-dir={str(self.profile_dir)}", "about:blank"]
+        self.proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-    shutil.rmtree(file_profile, ignore_errors=True)
-    return proc
+        # Never leave a half-started browser holding the worker's user-data-dir.
+        try:
+            # The browser writes "<port>\n<browser ws path>" once DevTools is listening.
+            deadline = time.monotonic() + BROWSER_STARTUP_TIMEOUT
+            while True:
+                if self.proc.poll() is not None:
+                    raise RuntimeError(f"Browser exited during startup (code {self.proc.returncode}).")
+                try:
+                    lines = port_file.read_text(encoding="utf-8").splitlines()
+                except OSError:
+                    lines = []
+                if len(lines) >= 2:
+                    break
+                if time.monotonic() > deadline:
+                    raise RuntimeError("Timed out waiting for the browser DevTools endpoint.")
+                time.sleep(0.1)
+
+            self.ws = websocket.create_connection(
+                f"ws://127.0.0.1:{lines[0].strip()}{lines[1].strip()}",
+                timeout=BROWSER_RENDER_TIMEOUT,
+                suppress_origin=True,
+            )
+            target_id = self.call("Target.createTarget", {"url": "about:blank"}, page=False)["targetId"]
+            attached = self.call("Target.attachToTarget", {"targetId": target_id, "flatten": True}, page=False)
+            self.session_id = attached["sessionId"]
+            self.call("Page.enable")
+        except BaseException:
+            self.close()
+            raise
+
+    def call(self, method: str, params: Optional[dict] = None, page: bool = True, deadline: Optional[float] = None) -> dict:
+        self.next_id += 1
+        msg_id = self.next_id
+        request = {"id": msg_id, "method": method, "params": params or {}}
+        if page:
+            request["sessionId"] = self.session_id
+        self.ws.send(json.dumps(request))
+        while True:
+            msg = self.recv(deadline, method)
+            if msg.get("id") == msg_id:
+                if "error" in msg:
+                    raise RuntimeError(f"{method}: {msg['error'].get('message', msg['error'])}")
+                return msg.get("result", {})
+            if "method" in msg:
+                self.events.append(msg)
+
+    def recv(self, deadline: Optional[float], waiting_for: str) -> dict:
+        # The socket timeout only bounds a single recv(); a steady stream of unrelated
+        # events would reset it forever, so the overall deadline is checked here too.
+        if deadline is None:
+            self.ws.settimeout(BROWSER_RENDER_TIMEOUT)
+        else:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(f"Timed out after {BROWSER_RENDER_TIMEOUT}s waiting for {waiting_for}.")
+            self.ws.settimeout(remaining)
+        try:
+            return json.loads(self.ws.recv())
+        except websocket.WebSocketTimeoutException:
+            raise RuntimeError(f"Timed out after {BROWSER_RENDER_TIMEOUT}s waiting for {waiting_for}.") from None
+
+    def wait_event(self, method: str, deadline: Optional[float] = None) -> dict:
+        while True:
+            for i, msg in enumerate(self.events):
+                if msg.get("method") == method and msg.get("sessionId") == self.session_id:
+                    del self.events[: i + 1]
+                    return msg.get("params", {})
+            self.events.clear()
+            msg = self.recv(deadline, method)
+            if "method" in msg:
+                self.events.append(msg)
+
+    def print_to_pdf(self, uri: str) -> bytes:
+        # BROWSER_RENDER_TIMEOUT bounds the whole navigate/load/print sequence for one file.
+        deadline = time.monotonic() + BROWSER_RENDER_TIMEOUT
+        self.events.clear()
+        nav = self.call("Page.navigate", {"url": uri}, deadline=deadline)
+        if nav.get("errorText"):
+            raise RuntimeError(f"{nav['errorText']} ({uri})")
+        self.wait_event("Page.loadEventFired", deadline)
+        # Match the header/footer layout produced by the --print-to-pdf command line.
+        result = self.call("Page.printToPDF", {"displayHeaderFooter": True}, deadline=deadline)
+        return base64.b64decode(result.get("data", ""))
+
+    def close(self) -> None:
+        if self.ws is None and self.proc is not None and self.proc.poll() is None:
+            # No DevTools connection to ask for a clean shutdown.
+            self.proc.terminate()
+        if self.ws is not None:
+            try:
+                self.call("Browser.close", page=False, deadline=time.monotonic() + 5)
+            except Exception:
+                pass
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+            self.ws = None
+        if self.proc is not None:
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+            self.proc = None
+
+
+def worker_browser(browser_exe: Path) -> CdpBrowser:
+    browser = getattr(_worker_state, "browser", None)
+    if browser is None:
+        browser = CdpBrowser(browser_exe, _worker_state.profile_dir)
+        with _browsers_lock:
+            _browsers.append(browser)
+        browser.start()
+        _worker_state.browser = browser
+    return browser
+
+
+def discard_worker_browser() -> None:
+    # A failed render can leave the page mid-navigation; restart on next use.
+    browser = getattr(_worker_state, "browser", None)
+    if browser is not None:
+        _worker_state.browser = None
+        browser.close()
+
+
+def render_pdf(browser: CdpBrowser, in_file: Path, out_pdf: Path) -> None:
+    uri = in_file.resolve().as_uri()
+    out_pdf.write_bytes(browser.print_to_pdf(uri))
 
 
 def apply_pdf_metadata(pdf_path: Path, meta: ExtractedMetadata, source_file: Path, converted_iso: str) -> None:
-    reader = PdfReader(str(pdf_path))
-    writer = PdfWriter(clone_from=reader)
-
     published_iso = meta.published_date_iso or filetime_fallback(source_file)
     title = meta.title or source_file.stem
 
@@ -372,7 +702,7 @@ def apply_pdf_metadata(pdf_path: Path, meta: ExtractedMetadata, source_file: Pat
         "/Subject": subject,
         "/Keywords": meta.keywords or "",
         "/Creator": "mht2pdf metadata pipeline",
-        "/Producer": "mht2pdf + pypdf",
+        "/Producer": "mht2pdf + pikepdf",
         "/CreationDate": pdf_dt_from_iso(published_iso),
         "/ModDate": pdf_dt_from_iso(converted_iso),
         "/SourceURL": meta.source_url or "",
@@ -383,28 +713,173 @@ def apply_pdf_metadata(pdf_path: Path, meta: ExtractedMetadata, source_file: Pat
         "/ContentSHA256": meta.content_sha256 or "",
         "/SourceMIME": meta.source_mime or "",
     }
-    writer.add_metadata(info)
-
-    # XMP packet with same high-value fields
-    xmp = XmpInformation.create()
-    xmp.dc_title = {"x-default": title}
-    xmp.dc_creator = [meta.author] if meta.author else ["Unknown"]
-    xmp.dc_identifier = [meta.source_url] if meta.source_url else []
-    xmp.dc_description = {"x-default": subject}
-    xmp.dc_date = [published_iso]
-    if meta.keywords:
-        xmp.dc_subject = [k.strip() for k in meta.keywords.split(",") if k.strip()]
-    if meta.language:
-        xmp.dc_language = [meta.language]
-    if meta.publisher:
-        xmp.dc_publisher = [meta.publisher]
-    xmp.xmp_creatortool = "mht2pdf metadata pipeline"
-    writer.xmp_metadata = xmp
-
-    tmp_out = pdf_path.with_suffix(".tmp.pdf")
-    with tmp_out.open("wb") as f:
-        writer.write(f)
-    tmp_out.replace(pdf_path)
+    # Edit the existing object graph in place rather than cloning every object into a new writer.
+    with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+        # XMP packet with same high-value fields; docinfo is written explicitly below.
+        with pdf.open_metadata(set_pikepdf_as_editor=False, update_docinfo=False) as xmp:
+            xmp["dc:title"] = title
+            xmp["dc:creator"] = [meta.author] if meta.author else ["Unknown"]
+            if meta.source_url:
+                xmp["dc:identifier"] = meta.source_url
+            xmp["dc:description"] = subject
+            xmp["dc:date"] = [published_iso]
+            if meta.keywords:
+                xmp["dc:subject"] = [k.strip() for k in meta.keywords.split(",") if k.strip()]
+            if meta.language:
+                xmp["dc:language"] = [meta.language]
+            if meta.publisher:
+                xmp["dc:publisher"] = [meta.publisher]
+            xmp["xmp:CreatorTool"] = "mht2pdf metadata pipeline"
+
+        for key, value in info.items():
+            pdf.docinfo[key] = value
+        pdf.save(pdf_path)
+
+
+def iter_mht(root: Path, recurse: bool):
+    # scandir entries carry their type from the directory listing, so most
+    # filesystems need no extra stat per entry (unlike Path.is_file()).
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories (e.g. System Volume Information) are
+            # skipped, as Path.glob/rglob do; a missing root simply yields no files.
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recurse:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(MHT_SUFFIXES) and entry.is_file():
+                    yield Path(entry.path)
+
+
+def json_dumps_pretty(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_sidecar(sidecar: Path, src: Path) -> Optional[ExtractedMetadata]:
+    # A sidecar written after the source was last modified already holds its
+    # extracted metadata; reuse it instead of hashing and parsing the archive again.
+    try:
+        if sidecar.stat().st_mtime <= src.stat().st_mtime:
+            return None
+        data = json_loads(sidecar.read_bytes())
+    except (OSError, ValueError):
+        return None
+    # a.mht and a.mhtml share a.metadata.json; only reuse a sidecar written for this source.
+    if not isinstance(data, dict) or data.get("source_path") != str(src) or data.get("filename") != src.name:
+        return None
+    known = {f.name for f in dataclass_fields(ExtractedMetadata)}
+    return ExtractedMetadata(**{k: v for k, v in data.items() if k in known})
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    # The browser only needs the .mhtml extension, not a second copy of the bytes.
+    # Hardlinks fail across volumes or on some filesystems; copy in that case.
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def init_worker(run_profiles: Path) -> None:
+    # Each pool thread gets its own browser profile directory, created once and
+    # reused for every file it renders; concurrent Chrome instances cannot share one.
+    worker_id = next(_worker_ids)
+    profile_dir = run_profiles / f"worker-{worker_id}"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    _worker_state.profile_dir = profile_dir
+
+
+def output_lock(out_pdf: Path) -> threading.Lock:
+    key = os.path.normcase(str(out_pdf))
+    with _output_locks_lock:
+        return _output_locks.setdefault(key, threading.Lock())
+
+
+def convert_one(src: Path, ctx: ConvertContext) -> Tuple[Optional[bool], List[str]]:
+    rel = src.relative_to(ctx.source_root)
+    if ctx.has_explicit_output_root:
+        out_pdf = (ctx.output_root / rel).with_suffix(".pdf")
+        log_rel = out_pdf.relative_to(ctx.output_root)
+    elif ctx.use_per_dir_archive:
+        # src is already absolute (under the resolved source root), so no extra resolve() stat.
+        out_pdf = src.parent / "_pdf_archive" / f"{src.stem}.pdf"
+        log_rel = out_pdf.relative_to(ctx.source_root)
+    else:
+        out_pdf = (ctx.output_root / src.name).with_suffix(".pdf")
+        log_rel = out_pdf.relative_to(ctx.output_root)
+
+    # Notes are returned with the outcome so main logs them next to this file's result.
+    lines = []
+    adjusted = shorten_output_pdf_path(out_pdf, src)
+    if adjusted != out_pdf:
+        lines.append(f"ADJUST path: {rel} -> {adjusted.name}")
+        out_pdf = adjusted
+
+    # Distinct sources can share an output (a.mht and a.mhtml both become a.pdf);
+    # serialize them so two workers never write the same PDF and sidecar at once.
+    with output_lock(out_pdf):
+        status, msg = render_and_tag(src, rel, out_pdf, log_rel, ctx)
+    lines.append(msg)
+    return status, lines
+
+
+def render_and_tag(src: Path, rel: Path, out_pdf: Path, log_rel: Path, ctx: ConvertContext) -> Tuple[Optional[bool], str]:
+    if ctx.skip_existing and out_pdf.exists() and out_pdf.stat().st_size > 0:
+        return None, f"SKIP existing: {log_rel}"
+
+    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+    sidecar = out_pdf.with_suffix(".metadata.json")
+    render_input = src
+    temp_norm = None
+
+    try:
+        meta = load_sidecar(sidecar, src)
+        reused_sidecar = meta is not None
+        if not reused_sidecar:
+            meta = extract_from_mht(src)
+            meta.filename = src.name
+            meta.source_path = str(src)
+
+        if src.suffix.lower() == ".mht":
+            temp_norm = (ctx.norm_root / rel).with_suffix(".mhtml")
+            temp_norm.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(src, temp_norm)
+            render_input = temp_norm
+
+        try:
+            render_pdf(worker_browser(ctx.browser_exe), render_input, out_pdf)
+        except Exception as e:
+            discard_worker_browser()
+            return False, f"FAIL render: {rel} :: {e}"
+        if not out_pdf.exists() or out_pdf.stat().st_size == 0:
+            return False, f"FAIL render: {rel} :: empty PDF"
+
+        # Fallbacks requested by user
+        if not meta.title:
+            meta.title = src.stem
+        if not meta.published_date_iso:
+            meta.published_date_iso = filetime_fallback(src)
+
+        apply_pdf_metadata(out_pdf, meta, src, ctx.converted_iso)
+
+        # Sidecar for audit and future remapping
+        if not reused_sidecar:
+            sidecar.write_bytes(json_dumps_pretty(asdict(meta)))
+
+        return True, f"OK: {log_rel}"
+    except Exception as e:
+        return False, f"FAIL error: {rel} :: {e}"
+    finally:
+        if temp_norm and temp_norm.exists():
+            temp_norm.unlink(missing_ok=True)
 
 
 def main() -> int:
@@ -419,6 +894,7 @@ def main() -> int:
     ap.add_argument("--max-files", type=int, default=0)
     ap.add_argument("--skip-existing", action="store_true")
     ap.add_argument("--recurse-subdirs", action="store_true")
+    ap.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Number of files converted concurrently.")
     args = ap.parse_args()
 
     files = []
@@ -426,14 +902,10 @@ def main() -> int:
 
     if args.source_root:
         source_root = Path(normalize_path_arg(args.source_root)).resolve()
-        if args.recurse_subdirs:
-            candidates = source_root.rglob("*")
-        else:
-            candidates = source_root.glob("*")
-        files = [p for p in candidates if p.is_file() and p.suffix.lower() in {".mht", ".mhtml"}]
+        files = list(iter_mht(source_root, args.recurse_subdirs))
     else:
         raw_files = [Path(normalize_path_arg(p)).resolve() for p in (args.source_file or [])]
-        files = [p for p in raw_files if p.is_file() and p.suffix.lower() in {".mht", ".mhtml"}]
+        files = [p for p in raw_files if p.suffix.lower() in MHT_SUFFIXES and p.is_file()]
         if not files:
             raise RuntimeError("No valid --source-file entries were found.")
         common_parent = os.path.commonpath([str(p.parent) for p in files])
@@ -450,6 +922,7 @@ def main() -> int:
         log_path = (output_root / "logs" / "convert.log").resolve()
 
     output_root.mkdir(parents=True, exist_ok=True)
+    open_log(log_path)
     tmp_root = output_root.parent / "tmp"
     norm_root = tmp_root / "normalized-mhtml"
     profile_root = tmp_root / "chrome-profiles"
@@ -457,84 +930,48 @@ def main() -> int:
     profile_root.mkdir(parents=True, exist_ok=True)
 
     browser_exe = resolve_browser(args.browser)
-    log(f"Browser: {browser_exe}", log_path)
-    log(f"Source: {source_root}", log_path)
+    log(f"Browser: {browser_exe}")
+    log(f"Source: {source_root}")
 
     files.sort()
     if args.max_files > 0:
         files = files[: args.max_files]
-    log(f"Target count: {len(files)}", log_path)
+    log(f"Target count: {len(files)}")
+    jobs = max(1, args.jobs)
+    log(f"Jobs: {jobs}")
 
     ok = 0
     fail = 0
-    converted_iso = datetime.now(timezone.utc).isoformat()
-
-    for src in files:
-        rel = src.relative_to(source_root)
-        if has_explicit_output_root:
-            out_pdf = (output_root / rel).with_suffix(".pdf")
-            log_rel = out_pdf.relative_to(output_root)
-        elif args.source_file or args.recurse_subdirs:
-            out_pdf = (src.parent / "_pdf_archive" / f"{src.stem}.pdf").resolve()
-            log_rel = out_pdf.relative_to(source_root)
-        else:
-            out_pdf = (output_root / src.name).with_suffix(".pdf")
-            log_rel = out_pdf.relative_to(output_root)
-
-        adjusted = shorten_output_pdf_path(out_pdf, src)
-        if adjusted != out_pdf:
-            log(f"ADJUST path: {rel} -> {adjusted.name}", log_path)
-            out_pdf = adjusted
-
-        out_pdf.parent.mkdir(parents=True, exist_ok=True)
-
-        if args.skip_existing and out_pdf.exists() and out_pdf.stat().st_size > 0:
-            log(f"SKIP existing: {log_rel}", log_path)
-            continue
-
-        render_input = src
-        temp_norm = None
-
-        try:
-            meta = extract_from_mht(src)
-            meta.filename = src.name
-            meta.source_path = str(src)
-
-            if src.suffix.lower() == ".mht":
-                temp_norm = (norm_root / rel).with_suffix(".mhtml")
-                temp_norm.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, temp_norm)
-                render_input = temp_norm
-
-            proc = render_pdf(browser_exe, render_input, out_pdf, profile_root)
-            if not out_pdf.exists() or out_pdf.stat().st_size == 0:
-                err = (proc.stderr or proc.stdout or "").strip().splitlines()[:1]
-                log(f"FAIL render: {rel} :: {' '.join(err)}", log_path)
-                fail += 1
-                continue
-
-            # Fallbacks requested by user
-            if not meta.title:
-                meta.title = src.stem
-            if not meta.published_date_iso:
-                meta.published_date_iso = filetime_fallback(src)
-
-            apply_pdf_metadata(out_pdf, meta, src, converted_iso)
-
-            # Sidecar for audit and future remapping
-            sidecar = out_pdf.with_suffix(".metadata.json")
-            sidecar.write_text(json.dumps(asdict(meta), indent=2, ensure_ascii=False), encoding="utf-8")
-
-            log(f"OK: {log_rel}", log_path)
-            ok += 1
-        except Exception as e:
-            fail += 1
-            log(f"FAIL error: {rel} :: {e}", log_path)
-        finally:
-            if temp_norm and temp_norm.exists():
-                temp_norm.unlink(missing_ok=True)
+    ctx = ConvertContext(
+        source_root=source_root,
+        output_root=output_root,
+        has_explicit_output_root=has_explicit_output_root,
+        use_per_dir_archive=bool(args.source_file or args.recurse_subdirs),
+        skip_existing=args.skip_existing,
+        norm_root=norm_root,
+        browser_exe=browser_exe,
+        converted_iso=datetime.now(timezone.utc).isoformat(),
+    )
 
-    log(f"DONE ok={ok} fail={fail}", log_path)
+    # Runs whose output roots share a parent also share tmp/chrome-profiles, so each
+    # run keeps its worker profiles in its own directory and removes only that.
+    run_profiles = Path(tempfile.mkdtemp(prefix="run-", dir=profile_root))
+    try:
+        with ThreadPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(run_profiles,)) as executor:
+            for status, lines in executor.map(partial(convert_one, ctx=ctx), files):
+                for line in lines:
+                    log(line)
+                if status is True:
+                    ok += 1
+                elif status is False:
+                    fail += 1
+    finally:
+        for browser in _browsers:
+            browser.close()
+        # Worker profiles are reused across files and only removed once the run is over.
+        shutil.rmtree(run_profiles, ignore_errors=True)
+
+    log(f"DONE ok={ok} fail={fail}")
     return 2 if fail else 0
 
 